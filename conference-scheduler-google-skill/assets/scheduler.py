@@ -7,7 +7,11 @@ Supports single-day and multi-day conferences.
 """
 
 import csv
+import io
+import sys
 import argparse
+import itertools
+from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import Optional
 from ortools.sat.python import cp_model
@@ -22,11 +26,14 @@ class Timeslot:
     day_index: int = 0
     day_name: Optional[str] = None
 
+    def __post_init__(self):
+        h, m = map(int, self.from_hour.split(':'))
+        self._slot_index = self.day_index * 10000 + h * 60 + m
+
     @property
     def slot_index(self) -> int:
         """Numeric index for ordering (day * 10000 + minutes from midnight)."""
-        h, m = map(int, self.from_hour.split(':'))
-        return self.day_index * 10000 + h * 60 + m
+        return self._slot_index
 
     @property
     def day_display(self) -> str:
@@ -59,20 +66,29 @@ class Talk:
     timeslot: Optional[Timeslot] = None
     room: Optional[Room] = None
 
+    def __post_init__(self):
+        self._speakers = tuple(s.strip() for s in self.speaker_names.split(',') if s.strip())
+        self._speakers_lower = frozenset(s.lower() for s in self._speakers)
+        self._level_order = {"BEGINNER": 1, "INTERMEDIATE": 2, "ADVANCED": 3}.get(
+            self.audience_level.upper(), 2
+        )
+
     @property
     def level_order(self) -> int:
         """Numeric level for educational flow (lower = earlier)."""
-        return {"BEGINNER": 1, "INTERMEDIATE": 2, "ADVANCED": 3}.get(
-            self.audience_level.upper(), 2
-        )
+        return self._level_order
 
     def is_available_on(self, day_index: int) -> bool:
         """Check if speaker is available on given day."""
         return len(self.available_days) == 0 or day_index in self.available_days
 
-    def speakers_list(self) -> list[str]:
-        """Get list of individual speakers."""
-        return [s.strip() for s in self.speaker_names.split(',') if s.strip()]
+    def speakers_list(self) -> tuple[str, ...]:
+        """Get individual speakers."""
+        return self._speakers
+
+    def speakers_lower(self) -> frozenset[str]:
+        """Lowercased speaker names, for case-insensitive matching."""
+        return self._speakers_lower
 
     def __hash__(self):
         return hash(self.id)
@@ -84,8 +100,9 @@ def read_schedule_csv(path: Path) -> tuple[list[Timeslot], list[Room], list[str]
     rooms_set = set()
     day_map = {}
     
+    # skipinitialspace lets csv.reader unquote fields written as '; "value"'
     with open(path, 'r', encoding='utf-8') as f:
-        reader = csv.reader(f, delimiter=';', quotechar='"')
+        reader = csv.reader(f, delimiter=';', quotechar='"', skipinitialspace=True)
         header = next(reader)
         
         # Detect if multi-day format (first column contains "day")
@@ -103,13 +120,13 @@ def read_schedule_csv(path: Path) -> tuple[list[Timeslot], list[Room], list[str]
             day_name = None
             day_index = 0
             if has_day:
-                day_name = row[day_col].strip().strip('"')
+                day_name = row[day_col].strip()
                 if day_name not in day_map:
                     day_map[day_name] = len(day_map)
                 day_index = day_map[day_name]
             
-            from_hour = row[from_col].strip().strip('"')
-            to_hour = row[to_col].strip().strip('"')
+            from_hour = row[from_col].strip()
+            to_hour = row[to_col].strip()
             
             # Create unique timeslot ID
             slot_id = f"D{day_index}-{from_hour}-{to_hour}" if has_day else f"{from_hour}-{to_hour}"
@@ -119,7 +136,7 @@ def read_schedule_csv(path: Path) -> tuple[list[Timeslot], list[Room], list[str]
                 timeslots.append(Timeslot(slot_id, from_hour, to_hour, day_index, day_name))
             
             if len(row) > room_col:
-                room_name = row[room_col].strip().strip('"')
+                room_name = row[room_col].strip()
                 if room_name:
                     rooms_set.add(room_name)
     
@@ -133,39 +150,59 @@ def read_schedule_csv(path: Path) -> tuple[list[Timeslot], list[Room], list[str]
 def read_talks_csv(path: Path, day_names: list[str]) -> list[Talk]:
     """Read talks CSV."""
     talks = []
+    day_names_lower = [d.lower() for d in day_names]
     
     with open(path, 'r', encoding='utf-8') as f:
-        reader = csv.reader(f, delimiter=';', quotechar='"')
-        next(reader)  # Skip header
+        text = f.read()
+    
+    # Without any quoting below the header, plain splitting yields the same rows
+    # as csv.reader at a fraction of the cost
+    header_end = text.find('\n')
+    body = text[header_end + 1:] if header_end >= 0 else ''
+    if '"' not in body:
+        rows = (line.split(';') for line in body.split('\n'))
+    else:
+        # skipinitialspace lets csv.reader unquote fields written as '; "value"'
+        rows = csv.reader(io.StringIO(text), delimiter=';', quotechar='"', skipinitialspace=True)
+        next(rows)  # Skip header
+    
+    for row in rows:
+        if len(row) < 9:
+            continue
         
-        for row in reader:
-            if len(row) < 9:
-                continue
-            
-            talk = Talk(
-                id=row[0].strip().strip('"'),
-                title=row[1].strip().strip('"'),
-                summary=row[3].strip().strip('"'),
-                track_name=row[4].strip().strip('"'),
-                audience_level=row[2].strip().strip('"').upper() or "INTERMEDIATE",
-                speaker_names=row[8].strip().strip('"'),
-            )
-            
-            # Parse available days
-            avail_str = row[5].strip().strip('"') if len(row) > 5 else ""
-            if avail_str:
-                talk.available_days = parse_available_days(avail_str, day_names)
-            
-            # Default flow order based on level
-            talk.flow_order = talk.level_order
-            
-            talks.append(talk)
+        talk = Talk(
+            id=row[0].strip(),
+            title=row[1].strip(),
+            summary=row[3].strip(),
+            track_name=row[4].strip(),
+            audience_level=row[2].strip().upper() or "INTERMEDIATE",
+            speaker_names=row[8].strip(),
+        )
+        
+        # Parse available days
+        avail_str = row[5].strip() if len(row) > 5 else ""
+        if avail_str:
+            talk.available_days = parse_available_days(avail_str, day_names, day_names_lower)
+        
+        # Default flow order based on level
+        talk.flow_order = talk.level_order
+        
+        talks.append(talk)
     
     return talks
 
 
-def parse_available_days(avail_str: str, day_names: list[str]) -> set[int]:
-    """Parse availability string like 'Wednesday,Thursday' or '1,2,3'."""
+def parse_available_days(
+    avail_str: str,
+    day_names: list[str],
+    day_names_lower: Optional[list[str]] = None
+) -> set[int]:
+    """
+    Parse availability string like 'Wednesday,Thursday' or '1,2,3'.
+    Callers parsing many rows can pass day_names lowercased once as day_names_lower.
+    """
+    if day_names_lower is None:
+        day_names_lower = [d.lower() for d in day_names]
     available = set()
     for part in avail_str.replace(';', ',').split(','):
         part = part.strip().lower()
@@ -180,26 +217,73 @@ def parse_available_days(avail_str: str, day_names: list[str]) -> set[int]:
             pass
         
         # Try matching day names
-        for i, day_name in enumerate(day_names):
-            if part in day_name.lower() or day_name.lower() in part:
+        for i, day_name in enumerate(day_names_lower):
+            if part in day_name or day_name in part:
                 available.add(i)
                 break
     
     return available
 
 
-def has_speaker_overlap(talk1: Talk, talk2: Talk) -> bool:
-    """Check if two talks share any speaker."""
-    speakers1 = set(s.lower() for s in talk1.speakers_list())
-    speakers2 = set(s.lower() for s in talk2.speakers_list())
-    return bool(speakers1 & speakers2)
+def speaker_conflict_pairs(talks: list[Talk]) -> set[tuple[int, int]]:
+    """Index pairs (t1 < t2) of talks sharing at least one speaker."""
+    speaker_talks = defaultdict(list)
+    for t, talk in enumerate(talks):
+        for name in talk.speakers_lower():
+            speaker_talks[name].append(t)
+    
+    pairs = set()
+    for talk_indices in speaker_talks.values():
+        pairs.update(itertools.combinations(talk_indices, 2))
+    return pairs
+
+
+def greedy_schedule(
+    timeslots: list[Timeslot],
+    rooms: list[Room],
+    talks: list[Talk]
+) -> dict[int, tuple[int, int]]:
+    """
+    Greedily pack talks into the first free (timeslot, room) respecting hard constraints.
+    Most restricted talks go first, then by level. Returns {talk_idx: (slot_idx, room_idx)};
+    talks that don't fit are left out.
+    """
+    order = sorted(
+        range(len(talks)),
+        key=lambda t: (len(talks[t].available_days) or float('inf'), talks[t].level_order)
+    )
+    rooms_used = [0] * len(timeslots)
+    slot_tracks = [set() for _ in timeslots]
+    slot_speakers = [set() for _ in timeslots]
+    
+    placement = {}
+    for t in order:
+        talk = talks[t]
+        speakers = talk.speakers_lower()
+        for s, timeslot in enumerate(timeslots):
+            if (rooms_used[s] < len(rooms)
+                    and talk.is_available_on(timeslot.day_index)
+                    and talk.track_name not in slot_tracks[s]
+                    and not speakers & slot_speakers[s]):
+                placement[t] = (s, rooms_used[s])
+                rooms_used[s] += 1
+                slot_tracks[s].add(talk.track_name)
+                slot_speakers[s] |= speakers
+                break
+    
+    return placement
 
 
 def solve_schedule(
     timeslots: list[Timeslot],
     rooms: list[Room], 
     talks: list[Talk],
-    time_limit_seconds: int = 30
+    time_limit_seconds: int = 30,
+    workers: int = 0,
+    verbose: bool = False,
+    use_core: bool = False,
+    linearization_level: int = 1,
+    hint: bool = True
 ) -> tuple[list[Talk], str]:
     """
     Solve the conference scheduling problem using OR-Tools CP-SAT.
@@ -211,38 +295,30 @@ def solve_schedule(
     num_timeslots = len(timeslots)
     num_rooms = len(rooms)
     
+    # Talks with nowhere to go: report it as CP-SAT would, rather than building
+    # empty-domain variables that make the model invalid
+    if num_talks and (num_timeslots == 0 or num_rooms == 0):
+        return talks, "INFEASIBLE"
+    
     # Create indices
     timeslot_idx = {t.id: i for i, t in enumerate(timeslots)}
     room_idx = {r.name: i for i, r in enumerate(rooms)}
     
-    # Decision variables: assign[talk][timeslot][room] = 1 if talk is assigned there
-    assign = {}
-    for t in range(num_talks):
-        for s in range(num_timeslots):
-            for r in range(num_rooms):
-                assign[(t, s, r)] = model.NewBoolVar(f'assign_t{t}_s{s}_r{r}')
-    
-    # Each talk must be assigned to exactly one slot+room
-    for t in range(num_talks):
-        model.AddExactlyOne(assign[(t, s, r)] 
-                           for s in range(num_timeslots) 
-                           for r in range(num_rooms))
+    # Decision variables: slot[talk] and room[talk] index into timeslots/rooms
+    slot = [model.NewIntVar(0, num_timeslots - 1, f'slot_{t}') for t in range(num_talks)]
+    room = [model.NewIntVar(0, num_rooms - 1, f'room_{t}') for t in range(num_talks)]
     
     # HARD CONSTRAINT: Room conflict - max one talk per room per timeslot
-    for s in range(num_timeslots):
-        for r in range(num_rooms):
-            model.AddAtMostOne(assign[(t, s, r)] for t in range(num_talks))
+    # Each (timeslot, room) pair is encoded as a single cell index
+    cell = []
+    for t in range(num_talks):
+        cell.append(model.NewIntVar(0, num_timeslots * num_rooms - 1, f'cell_{t}'))
+        model.Add(cell[t] == slot[t] * num_rooms + room[t])
+    model.AddAllDifferent(cell)
     
     # HARD CONSTRAINT: Speaker conflict - same speaker can't be in two places
-    for t1 in range(num_talks):
-        for t2 in range(t1 + 1, num_talks):
-            if has_speaker_overlap(talks[t1], talks[t2]):
-                for s in range(num_timeslots):
-                    # Can't both be in same timeslot (any room)
-                    model.AddAtMostOne(
-                        [assign[(t1, s, r)] for r in range(num_rooms)] +
-                        [assign[(t2, s, r)] for r in range(num_rooms)]
-                    )
+    for t1, t2 in speaker_conflict_pairs(talks):
+        model.Add(slot[t1] != slot[t2])
     
     # HARD CONSTRAINT: Track conflict - same track can't run in parallel
     track_talks = {}
@@ -251,67 +327,75 @@ def solve_schedule(
     
     for track, track_talk_indices in track_talks.items():
         if len(track_talk_indices) > 1:
-            for s in range(num_timeslots):
-                # At most one talk from this track in this timeslot
-                model.AddAtMostOne(
-                    assign[(t, s, r)]
-                    for t in track_talk_indices
-                    for r in range(num_rooms)
-                )
+            model.AddAllDifferent(slot[t] for t in track_talk_indices)
+    
+    # SYMMETRY BREAKING: talks with identical constraints are interchangeable,
+    # so fix their relative order instead of letting the solver explore every permutation
+    interchangeable = defaultdict(list)
+    for t, talk in enumerate(talks):
+        key = (talk.track_name, talk.level_order, talk.flow_order,
+               frozenset(talk.available_days), talk.speakers_lower())
+        interchangeable[key].append(t)
+    
+    for group in interchangeable.values():
+        for t1, t2 in zip(group, group[1:]):
+            model.Add(slot[t1] < slot[t2])
     
     # HARD CONSTRAINT: Speaker availability
+    # One table constraint per restricted talk, using the smaller of the allowed/forbidden lists
+    day_slots = defaultdict(list)
+    for s, timeslot in enumerate(timeslots):
+        day_slots[timeslot.day_index].append([s])
+    
     for t, talk in enumerate(talks):
         if talk.available_days:
-            for s, timeslot in enumerate(timeslots):
-                if timeslot.day_index not in talk.available_days:
-                    # Speaker not available this day - forbid all rooms
-                    for r in range(num_rooms):
-                        model.Add(assign[(t, s, r)] == 0)
+            allowed = [s for day, slots in day_slots.items() if day in talk.available_days for s in slots]
+            forbidden = [s for day, slots in day_slots.items() if day not in talk.available_days for s in slots]
+            if not forbidden:
+                continue
+            if len(allowed) <= len(forbidden):
+                model.AddAllowedAssignments([slot[t]], allowed)
+            else:
+                model.AddForbiddenAssignments([slot[t]], forbidden)
     
     # SOFT CONSTRAINTS - Educational flow
-    # Create helper variables for timeslot assignment
-    talk_timeslot = {}
-    for t in range(num_talks):
-        talk_timeslot[t] = model.NewIntVar(0, num_timeslots - 1, f'timeslot_{t}')
-        model.Add(talk_timeslot[t] == sum(
-            s * assign[(t, s, r)]
-            for s in range(num_timeslots)
-            for r in range(num_rooms)
-        ))
-    
-    # Soft constraint penalties
     soft_penalties = []
+    flow_pairs = []
     
     # Educational flow: within same track and day, prefer beginner before advanced
     for track, track_talk_indices in track_talks.items():
-        if len(track_talk_indices) > 1:
-            for i, t1 in enumerate(track_talk_indices):
-                for t2 in enumerate(track_talk_indices[i+1:]):
-                    t2_idx = track_talk_indices[i + 1 + t2[0]]
-                    level1 = talks[t1].level_order
-                    level2 = talks[t2_idx].level_order
-                    
-                    if level1 != level2:
-                        # Penalty if higher level comes before lower level
-                        violation = model.NewBoolVar(f'flow_violation_{t1}_{t2_idx}')
-                        if level1 > level2:
-                            # t1 has higher level, should come after t2
-                            model.Add(talk_timeslot[t1] < talk_timeslot[t2_idx]).OnlyEnforceIf(violation)
-                            model.Add(talk_timeslot[t1] >= talk_timeslot[t2_idx]).OnlyEnforceIf(violation.Not())
-                        else:
-                            # t1 has lower level, should come before t2
-                            model.Add(talk_timeslot[t1] > talk_timeslot[t2_idx]).OnlyEnforceIf(violation)
-                            model.Add(talk_timeslot[t1] <= talk_timeslot[t2_idx]).OnlyEnforceIf(violation.Not())
-                        
-                        soft_penalties.append(violation)
+        for i, t1 in enumerate(track_talk_indices):
+            for t2 in track_talk_indices[i + 1:]:
+                level1 = talks[t1].level_order
+                level2 = talks[t2].level_order
+                if level1 == level2:
+                    continue
+                
+                # Penalty if higher level comes before lower level
+                later, earlier = (t1, t2) if level1 > level2 else (t2, t1)
+                violation = model.NewBoolVar(f'flow_violation_{later}_{earlier}')
+                # Half-reified: minimization keeps violation false whenever the order holds
+                model.Add(slot[later] >= slot[earlier]).OnlyEnforceIf(violation.Not())
+                soft_penalties.append(violation)
+                flow_pairs.append((later, earlier))
     
     # Minimize soft constraint violations
     if soft_penalties:
         model.Minimize(sum(soft_penalties))
     
+    # Warm start: hints only guide branching, they don't restrict the search
+    if hint:
+        for t, (s, r) in greedy_schedule(timeslots, rooms, talks).items():
+            model.AddHint(slot[t], s)
+            model.AddHint(room[t], r)
+    
     # Solve
     solver = cp_model.CpSolver()
     solver.parameters.max_time_in_seconds = time_limit_seconds
+    solver.parameters.num_workers = workers
+    solver.parameters.log_search_progress = verbose
+    solver.parameters.optimize_with_core = use_core
+    solver.parameters.linearization_level = linearization_level
     status = solver.Solve(model)
     
     status_names = {
@@ -325,110 +409,120 @@ def solve_schedule(
     
     # Extract solution
     if status in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+        slot_values = [solver.Value(slot[t]) for t in range(num_talks)]
         for t, talk in enumerate(talks):
-            for s in range(num_timeslots):
-                for r in range(num_rooms):
-                    if solver.Value(assign[(t, s, r)]) == 1:
-                        talk.timeslot = timeslots[s]
-                        talk.room = rooms[r]
-                        break
+            talk.timeslot = timeslots[slot_values[t]]
+            talk.room = rooms[solver.Value(room[t])]
         
-        soft_score = -int(solver.ObjectiveValue()) if soft_penalties else 0
-        status_msg = f"{status_msg} (soft penalty: {-soft_score})"
+        # Count violations from the schedule itself: the half-reified penalties
+        # may be left true on a time-limited solution, so the objective value
+        # is only an upper bound
+        soft_penalty = sum(
+            1 for later, earlier in flow_pairs if slot_values[later] < slot_values[earlier]
+        )
+        status_msg = f"{status_msg} (soft penalty: {soft_penalty})"
     
     return talks, status_msg
 
 
+def _decorate_sort(talks: list[Talk]) -> list[tuple]:
+    """
+    Scheduled talks as (slot_index, room_name, day_index, slot_id, position, talk) tuples,
+    sorted by time then room. Keys are read once so the sort compares plain tuples.
+    """
+    decorated = [
+        (t.timeslot.slot_index, t.room.name, t.timeslot.day_index, t.timeslot.id, i, t)
+        for i, t in enumerate(talks) if t.timeslot and t.room
+    ]
+    decorated.sort()
+    return decorated
+
+
 def write_csv_output(talks: list[Talk], path: Path, multi_day: bool):
     """Write schedule to CSV."""
-    scheduled = [t for t in talks if t.timeslot and t.room]
-    scheduled.sort(key=lambda t: (t.timeslot.slot_index, t.room.name))
+    scheduled = _decorate_sort(talks)
     
     with open(path, 'w', newline='', encoding='utf-8') as f:
         writer = csv.writer(f, delimiter=';', quotechar='"', quoting=csv.QUOTE_ALL)
         
         if multi_day:
             writer.writerow(['Day', 'Talk ID', 'From', 'To', 'Room', 'Title', 'Speakers', 'Level', 'Track'])
-            for t in scheduled:
-                writer.writerow([
-                    t.timeslot.day_display, t.id, t.timeslot.from_hour, t.timeslot.to_hour,
-                    t.room.name, t.title, t.speaker_names, t.audience_level, t.track_name
-                ])
+            writer.writerows(
+                (t.timeslot.day_display, t.id, t.timeslot.from_hour, t.timeslot.to_hour,
+                 room_name, t.title, t.speaker_names, t.audience_level, t.track_name)
+                for _, room_name, _, _, _, t in scheduled
+            )
         else:
             writer.writerow(['Talk ID', 'From', 'To', 'Room', 'Title', 'Speakers', 'Level', 'Track'])
-            for t in scheduled:
-                writer.writerow([
-                    t.id, t.timeslot.from_hour, t.timeslot.to_hour,
-                    t.room.name, t.title, t.speaker_names, t.audience_level, t.track_name
-                ])
+            writer.writerows(
+                (t.id, t.timeslot.from_hour, t.timeslot.to_hour,
+                 room_name, t.title, t.speaker_names, t.audience_level, t.track_name)
+                for _, room_name, _, _, _, t in scheduled
+            )
 
 
 def write_markdown_output(talks: list[Talk], path: Path, multi_day: bool):
     """Write schedule to Markdown."""
-    scheduled = [t for t in talks if t.timeslot and t.room]
-    scheduled.sort(key=lambda t: (t.timeslot.slot_index, t.room.name))
-    
-    lines = ["# Conference Schedule\n"]
+    buf = io.StringIO()
+    buf.write("# Conference Schedule\n")
     
     current_day = -1
     current_slot = None
     
-    for talk in scheduled:
-        ts = talk.timeslot
-        
+    for _, room_name, day_index, slot_id, _, talk in _decorate_sort(talks):
         # Day header for multi-day
-        if multi_day and ts.day_index != current_day:
-            current_day = ts.day_index
+        if multi_day and day_index != current_day:
+            current_day = day_index
             current_slot = None
-            lines.append(f"\n---\n\n# {ts.day_display}\n")
+            buf.write(f"\n---\n\n# {talk.timeslot.day_display}\n")
         
         # Timeslot header
-        if ts.id != current_slot:
-            current_slot = ts.id
-            lines.append(f"\n## {ts.from_hour} - {ts.to_hour}\n")
-            lines.append("\n| Room | ID | Title | Speaker | Level | Track |")
-            lines.append("\n|------|-----|-------|---------|-------|-------|")
+        if slot_id != current_slot:
+            current_slot = slot_id
+            ts = talk.timeslot
+            buf.write(f"\n## {ts.from_hour} - {ts.to_hour}\n"
+                      "\n| Room | ID | Title | Speaker | Level | Track |"
+                      "\n|------|-----|-------|---------|-------|-------|")
         
         title = talk.title.replace('|', '\\|')
-        lines.append(f"\n| {talk.room.name} | {talk.id} | {title} | {talk.speaker_names} | {talk.audience_level} | {talk.track_name} |")
+        buf.write(f"\n| {room_name} | {talk.id} | {title} | {talk.speaker_names} | {talk.audience_level} | {talk.track_name} |")
     
     with open(path, 'w', encoding='utf-8') as f:
-        f.write(''.join(lines))
+        f.write(buf.getvalue())
 
 
 def print_schedule(talks: list[Talk], multi_day: bool):
     """Print schedule to console."""
-    scheduled = [t for t in talks if t.timeslot and t.room]
-    scheduled.sort(key=lambda t: (t.timeslot.slot_index, t.room.name))
-    
-    print("\n" + "=" * 100)
-    print("CONFERENCE SCHEDULE")
-    print("=" * 100)
+    out = []
+    out.append("\n" + "=" * 100)
+    out.append("CONFERENCE SCHEDULE")
+    out.append("=" * 100)
     
     current_day = -1
     current_slot = None
     
-    for talk in scheduled:
-        ts = talk.timeslot
-        
-        if multi_day and ts.day_index != current_day:
-            current_day = ts.day_index
+    for _, room_name, day_index, slot_id, _, talk in _decorate_sort(talks):
+        if multi_day and day_index != current_day:
+            current_day = day_index
             current_slot = None
-            print("\n" + "=" * 100)
-            print(f">>> {ts.day_display.upper()} <<<")
-            print("=" * 100)
+            out.append("\n" + "=" * 100)
+            out.append(f">>> {talk.timeslot.day_display.upper()} <<<")
+            out.append("=" * 100)
         
-        if ts.id != current_slot:
-            current_slot = ts.id
-            print("\n" + "-" * 100)
-            print(f"TIME SLOT: {ts.from_hour} - {ts.to_hour}")
-            print("-" * 100)
+        if slot_id != current_slot:
+            current_slot = slot_id
+            ts = talk.timeslot
+            out.append("\n" + "-" * 100)
+            out.append(f"TIME SLOT: {ts.from_hour} - {ts.to_hour}")
+            out.append("-" * 100)
         
         title = talk.title[:50] + "..." if len(talk.title) > 50 else talk.title
         speaker = talk.speaker_names[:20] + "..." if len(talk.speaker_names) > 20 else talk.speaker_names
-        print(f"  {talk.room.name:10} | {talk.id:>5} | {title:50} | {speaker:20} | {talk.audience_level:12} | {talk.track_name}")
+        out.append(f"  {room_name:10} | {talk.id:>5} | {title:50} | {speaker:20} | {talk.audience_level:12} | {talk.track_name}")
+    
+    out.append("\n" + "=" * 100)
     
-    print("\n" + "=" * 100)
+    sys.stdout.write('\n'.join(out) + '\n')
 
 
 def main():
@@ -437,6 +531,18 @@ def main():
     parser.add_argument('talks_csv', help='CSV file with talk details')
     parser.add_argument('output_csv', nargs='?', default='schedule_output.csv', help='Output CSV file')
     parser.add_argument('--time-limit', type=int, default=30, help='Solver time limit in seconds')
+    parser.add_argument('--workers', type=int, default=0,
+                        help='Parallel CP-SAT search workers (0 = one per available core)')
+    parser.add_argument('--verbose', action='store_true', help='Log CP-SAT search progress')
+    parser.add_argument('--core', action='store_true',
+                        help='Use core-based optimization. The objective is a sum of Boolean '
+                             'penalties, where core search can be much faster or much slower '
+                             'depending on the instance')
+    parser.add_argument('--linearization', type=int, default=1, choices=[0, 1, 2],
+                        help='CP-SAT linearization level: 0 = no LP relaxation, 2 = tightest '
+                             'LP (slower per node, stronger bounds on the penalty sum)')
+    parser.add_argument('--no-hint', dest='hint', action='store_false',
+                        help='Disable the greedy warm-start hint')
     args = parser.parse_args()
     
     print("=" * 60)
@@ -462,7 +568,12 @@ def main():
     
     # Solve
     print(f"\n⏱️  Solving with time limit: {args.time_limit} seconds...")
-    talks, status = solve_schedule(timeslots, rooms, talks, args.time_limit)
+    talks, status = solve_schedule(
+        timeslots, rooms, talks, args.time_limit,
+        workers=args.workers, verbose=args.verbose,
+        use_core=args.core, linearization_level=args.linearization,
+        hint=args.hint
+    )
     
     print(f"\n✅ Solving complete!")
     print(f"   Status: {status}")
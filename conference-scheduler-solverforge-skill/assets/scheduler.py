@@ -9,9 +9,11 @@ SolverForge: https://github.com/solverforge
 """
 
 import csv
+import io
 import argparse
+from itertools import groupby
 from dataclasses import dataclass, field
-from typing import Optional, List, Annotated
+from typing import Optional, List, Annotated, Iterable
 from pathlib import Path
 
 from solverforge_legacy.solver import SolverFactory
@@ -37,6 +39,7 @@ from solverforge_legacy.solver.score import (
     Joiners,
     ConstraintFactory,
     Constraint,
+    BiConstraintStream,
 )
 
 
@@ -45,6 +48,11 @@ from solverforge_legacy.solver.score import (
 # =============================================================================
 
 
+# Day availability is a bitmask with bit N set when available on day index N.
+# All bits set means no restriction.
+ALL_DAYS = -1
+
+
 @dataclass
 class Timeslot:
     """A time window when talks can be scheduled."""
@@ -53,12 +61,13 @@ class Timeslot:
     to_hour: str
     day_index: int = 0
     day_name: Optional[str] = None
+    # Numeric index for ordering (day * 10000 + minutes from midnight).
+    # Plain field so constraint filters read an int instead of re-parsing from_hour.
+    slot_index: int = field(init=False, default=0)
 
-    @property
-    def slot_index(self) -> int:
-        """Numeric index for ordering (day * 10000 + minutes from midnight)."""
+    def __post_init__(self):
         h, m = map(int, self.from_hour.split(':'))
-        return self.day_index * 10000 + h * 60 + m
+        self.slot_index = self.day_index * 10000 + h * 60 + m
 
     @property
     def day_display(self) -> str:
@@ -93,11 +102,11 @@ class Speaker:
     """A speaker who may present one or more talks."""
     id: Annotated[str, PlanningId]
     name: str
-    available_days: set = field(default_factory=set)
+    available_mask: int = ALL_DAYS
 
     def is_available_on(self, day_index: int) -> bool:
-        """Check if speaker is available on given day. Empty set means all days."""
-        return len(self.available_days) == 0 or day_index in self.available_days
+        """Check if speaker is available on given day."""
+        return (self.available_mask >> day_index) & 1 == 1
 
     def __hash__(self) -> int:
         return hash(self.id)
@@ -108,22 +117,6 @@ class Speaker:
         return self.id == other.id
 
 
-@dataclass
-class TalkSpeaker:
-    """Links a speaker to a talk (for proper constraint stream joins)."""
-    id: Annotated[str, PlanningId]
-    speaker: Speaker
-    talk_id: str
-
-    def __hash__(self) -> int:
-        return hash(self.id)
-
-    def __eq__(self, other) -> bool:
-        if not isinstance(other, TalkSpeaker):
-            return False
-        return self.id == other.id
-
-
 @dataclass
 class Talk:
     """A conference talk (problem fact - not the planning entity)."""
@@ -134,13 +127,20 @@ class Talk:
     audience_level: str
     speakers: List[Speaker] = field(default_factory=list)
     flow_order: int = 0
-
-    @property
-    def level_order(self) -> int:
-        """Numeric level for educational flow (lower = earlier)."""
-        return {"BEGINNER": 1, "INTERMEDIATE": 2, "ADVANCED": 3}.get(
+    # AND of all speakers' availability masks, set by create_problem
+    all_speakers_mask: int = ALL_DAYS
+    # IDs of other talks sharing a speaker with this one, set by create_problem
+    co_speaker_talk_ids: frozenset = field(default_factory=frozenset)
+    # Numeric level for educational flow (lower = earlier), computed once
+    level_order: int = field(init=False, default=2)
+    # Comma-separated speaker names for output, computed once
+    speakers_str: str = field(init=False, default="")
+
+    def __post_init__(self):
+        self.level_order = {"BEGINNER": 1, "INTERMEDIATE": 2, "ADVANCED": 3}.get(
             self.audience_level.upper(), 2
         )
+        self.speakers_str = ", ".join(s.name for s in self.speakers)
 
     def __hash__(self) -> int:
         return hash(self.id)
@@ -157,7 +157,13 @@ class TalkAssignment:
     """Planning entity: assigns a Talk to a Timeslot and Room."""
     id: Annotated[str, PlanningId]
     talk: Talk
-    timeslot: Annotated[Optional[Timeslot], PlanningVariable] = None
+    # Timeslots on days all of the talk's speakers can attend, set by create_problem
+    available_timeslots: Annotated[
+        List[Timeslot], ValueRangeProvider(id="availableTimeslots")
+    ] = field(default_factory=list)
+    timeslot: Annotated[
+        Optional[Timeslot], PlanningVariable(value_range_provider_refs=["availableTimeslots"])
+    ] = None
     room: Annotated[Optional[Room], PlanningVariable] = None
 
     def get_slot_index(self) -> Optional[int]:
@@ -183,10 +189,9 @@ class TalkAssignment:
 @dataclass
 class ConferenceSchedule:
     """The planning solution containing all problem facts and planning entities."""
-    timeslots: Annotated[List[Timeslot], ProblemFactCollectionProperty, ValueRangeProvider]
+    timeslots: Annotated[List[Timeslot], ProblemFactCollectionProperty]
     rooms: Annotated[List[Room], ProblemFactCollectionProperty, ValueRangeProvider]
     speakers: Annotated[List[Speaker], ProblemFactCollectionProperty]
-    talk_speakers: Annotated[List[TalkSpeaker], ProblemFactCollectionProperty]
     talks: Annotated[List[Talk], ProblemFactCollectionProperty]
     talk_assignments: Annotated[List[TalkAssignment], PlanningEntityCollectionProperty]
     score: Annotated[Optional[HardSoftScore], PlanningScore] = None
@@ -224,7 +229,6 @@ def room_conflict(constraint_factory: ConstraintFactory) -> Constraint:
             Joiners.equal(lambda a: a.room),
             Joiners.equal(lambda a: a.timeslot),
         )
-        .filter(lambda a1, a2: a1.timeslot is not None and a1.room is not None)
         .penalize(HardSoftScore.ONE_HARD)
         .as_constraint("Room conflict")
     )
@@ -232,33 +236,12 @@ def room_conflict(constraint_factory: ConstraintFactory) -> Constraint:
 
 def speaker_conflict(constraint_factory: ConstraintFactory) -> Constraint:
     """Same speaker can't present simultaneously."""
-    # Use TalkSpeaker linking table for proper constraint stream tracking.
-    # Find pairs of TalkSpeakers with same speaker but different talks,
-    # then join to their assignments and check for timeslot collision.
     return (
         constraint_factory.for_each_unique_pair(
-            TalkSpeaker,
-            Joiners.equal(lambda ts: ts.speaker),
-        )
-        .join(
             TalkAssignment,
-            Joiners.equal(
-                lambda ts1, ts2: ts1.talk_id,
-                lambda a: a.talk.id,
-            ),
-        )
-        .join(
-            TalkAssignment,
-            Joiners.equal(
-                lambda ts1, ts2, a1: ts2.talk_id,
-                lambda a: a.talk.id,
-            ),
-            Joiners.equal(
-                lambda ts1, ts2, a1: a1.timeslot,
-                lambda a: a.timeslot,
-            ),
+            Joiners.equal(lambda a: a.timeslot),
         )
-        .filter(lambda ts1, ts2, a1, a2: a1.timeslot is not None)
+        .filter(lambda a1, a2: a2.talk.id in a1.talk.co_speaker_talk_ids)
         .penalize(HardSoftScore.ONE_HARD)
         .as_constraint("Speaker conflict")
     )
@@ -272,7 +255,6 @@ def track_conflict(constraint_factory: ConstraintFactory) -> Constraint:
             Joiners.equal(lambda a: a.talk.track_name),
             Joiners.equal(lambda a: a.timeslot),
         )
-        .filter(lambda a1, a2: a1.timeslot is not None)
         .penalize(HardSoftScore.ONE_HARD)
         .as_constraint("Track conflict")
     )
@@ -282,8 +264,7 @@ def speaker_availability(constraint_factory: ConstraintFactory) -> Constraint:
     """Speaker must be available on scheduled day."""
     return (
         constraint_factory.for_each(TalkAssignment)
-        .filter(lambda a: a.timeslot is not None)
-        .filter(lambda a: not _all_speakers_available(a.talk, a.get_day_index()))
+        .filter(lambda a: not ((a.talk.all_speakers_mask >> a.timeslot.day_index) & 1))
         .penalize(HardSoftScore.ONE_HARD)
         .as_constraint("Speaker availability")
     )
@@ -292,16 +273,36 @@ def speaker_availability(constraint_factory: ConstraintFactory) -> Constraint:
 # ===================== SOFT CONSTRAINTS =====================
 
 
+# The soft constraints all compare talks of the same track on the same day.
+# They build that pair stream through one helper with the same module-level key
+# functions, so the engine sees identical joiners and can share the join node.
+
+
+def _track_name(a: TalkAssignment) -> str:
+    return a.talk.track_name
+
+
+def _day_index(a: TalkAssignment) -> int:
+    return a.timeslot.day_index
+
+
+def _same_track_same_day_pairs(constraint_factory: ConstraintFactory) -> BiConstraintStream:
+    """Unique pairs of assignments in the same track on the same day."""
+    return constraint_factory.for_each_unique_pair(
+        TalkAssignment,
+        Joiners.equal(_track_name),
+        Joiners.equal(_day_index),
+    )
+
+
 def educational_flow_level(constraint_factory: ConstraintFactory) -> Constraint:
     """Prefer BEGINNER before INTERMEDIATE before ADVANCED within track and day."""
     return (
-        constraint_factory.for_each_unique_pair(
-            TalkAssignment,
-            Joiners.equal(lambda a: a.talk.track_name),
-            Joiners.equal(lambda a: a.get_day_index()),
-        )
-        .filter(lambda a1, a2: a1.timeslot is not None and a2.timeslot is not None)
-        .filter(lambda a1, a2: _violates_level_flow(a1, a2))
+        _same_track_same_day_pairs(constraint_factory)
+        .filter(lambda a1, a2: _violates_level_flow(
+            a1.talk.level_order, a2.talk.level_order,
+            a1.timeslot.slot_index, a2.timeslot.slot_index,
+        ))
         .penalize(HardSoftScore.ONE_SOFT)
         .as_constraint("Educational flow (level)")
     )
@@ -310,13 +311,11 @@ def educational_flow_level(constraint_factory: ConstraintFactory) -> Constraint:
 def educational_flow_order(constraint_factory: ConstraintFactory) -> Constraint:
     """Respect AI-computed flow order within track and day."""
     return (
-        constraint_factory.for_each_unique_pair(
-            TalkAssignment,
-            Joiners.equal(lambda a: a.talk.track_name),
-            Joiners.equal(lambda a: a.get_day_index()),
-        )
-        .filter(lambda a1, a2: a1.timeslot is not None and a2.timeslot is not None)
-        .filter(lambda a1, a2: _violates_flow_order(a1, a2))
+        _same_track_same_day_pairs(constraint_factory)
+        .filter(lambda a1, a2: _violates_flow_order(
+            a1.talk.flow_order, a2.talk.flow_order,
+            a1.timeslot.slot_index, a2.timeslot.slot_index,
+        ))
         .penalize(HardSoftScore.ONE_SOFT)
         .as_constraint("Educational flow (order)")
     )
@@ -325,12 +324,7 @@ def educational_flow_order(constraint_factory: ConstraintFactory) -> Constraint:
 def track_room_consistency(constraint_factory: ConstraintFactory) -> Constraint:
     """Prefer keeping same track in same room on same day."""
     return (
-        constraint_factory.for_each_unique_pair(
-            TalkAssignment,
-            Joiners.equal(lambda a: a.talk.track_name),
-            Joiners.equal(lambda a: a.get_day_index()),
-        )
-        .filter(lambda a1, a2: a1.room is not None and a2.room is not None)
+        _same_track_same_day_pairs(constraint_factory)
         .filter(lambda a1, a2: a1.room != a2.room)
         .penalize(HardSoftScore.ONE_SOFT)
         .as_constraint("Track room consistency")
@@ -340,45 +334,23 @@ def track_room_consistency(constraint_factory: ConstraintFactory) -> Constraint:
 # ===================== HELPER FUNCTIONS =====================
 
 
-def _all_speakers_available(talk: Talk, day_index: int) -> bool:
-    """Check if all speakers of a talk are available on the given day."""
-    if day_index is None:
-        return True
-    return all(s.is_available_on(day_index) for s in talk.speakers)
+# The flow predicates take plain ints: SolverForge compiles the filter lambdas to
+# Java bytecode, and int comparisons there are far cheaper than property lookups
+# or dict-building level conversions on every evaluated pair.
 
 
-def _violates_level_flow(a1: TalkAssignment, a2: TalkAssignment) -> bool:
-    """Check if a1 and a2 violate level-based educational flow."""
-    level1 = a1.talk.level_order
-    level2 = a2.talk.level_order
-    slot1 = a1.get_slot_index()
-    slot2 = a2.get_slot_index()
-    if slot1 is None or slot2 is None:
-        return False
+def _violates_level_flow(level1: int, level2: int, slot1: int, slot2: int) -> bool:
+    """Check if two talks violate level-based educational flow."""
     # Penalty if higher level comes before lower level
-    if level1 > level2 and slot1 < slot2:
-        return True
-    if level2 > level1 and slot2 < slot1:
-        return True
-    return False
+    return (level1 > level2 and slot1 < slot2) or (level2 > level1 and slot2 < slot1)
 
 
-def _violates_flow_order(a1: TalkAssignment, a2: TalkAssignment) -> bool:
-    """Check if a1 and a2 violate AI-computed flow order."""
-    order1 = a1.talk.flow_order
-    order2 = a2.talk.flow_order
+def _violates_flow_order(order1: int, order2: int, slot1: int, slot2: int) -> bool:
+    """Check if two talks violate AI-computed flow order."""
     if order1 == order2 or order1 == 0 or order2 == 0:
         return False
-    slot1 = a1.get_slot_index()
-    slot2 = a2.get_slot_index()
-    if slot1 is None or slot2 is None:
-        return False
     # Penalty if higher order comes before lower order
-    if order1 > order2 and slot1 < slot2:
-        return True
-    if order2 > order1 and slot2 < slot1:
-        return True
-    return False
+    return (order1 > order2 and slot1 < slot2) or (order2 > order1 and slot2 < slot1)
 
 
 # =============================================================================
@@ -386,56 +358,75 @@ def _violates_flow_order(a1: TalkAssignment, a2: TalkAssignment) -> bool:
 # =============================================================================
 
 
+def _read_csv_rows(path: Path) -> tuple[list[str], Iterable[list[str]]]:
+    """Read a semicolon-separated CSV, returns (header, rows)."""
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+
+    header_end = text.find('\n')
+    if header_end < 0:
+        header_end = len(text)
+    header = next(csv.reader([text[:header_end]], delimiter=';', quotechar='"',
+                             skipinitialspace=True), [])
+
+    # Without any quoting below the header, plain splitting yields the same rows
+    # as csv.reader at a fraction of the cost
+    body = text[header_end + 1:]
+    if '"' not in body:
+        return header, (line.split(';') for line in body.split('\n'))
+    # skipinitialspace lets csv.reader unquote fields written as '; "value"'
+    return header, csv.reader(io.StringIO(body), delimiter=';', quotechar='"',
+                              skipinitialspace=True)
+
+
 def read_schedule_csv(path: Path) -> tuple[list[Timeslot], list[Room], list[str]]:
     """Read schedule CSV, returns (timeslots, rooms, day_names)."""
     timeslots = []
     rooms_dict = {}
     day_map = {}
 
-    with open(path, 'r', encoding='utf-8') as f:
-        reader = csv.reader(f, delimiter=';', quotechar='"')
-        header = next(reader)
-
-        # Detect if multi-day format (first column contains "day")
-        has_day = header and 'day' in header[0].lower()
-        day_col = 0 if has_day else -1
-        from_col = 1 if has_day else 0
-        to_col = 2 if has_day else 1
-        room_col = 4 if has_day else 3
-
-        seen_slots = set()
-        for row in reader:
-            if len(row) < (3 if has_day else 2):
-                continue
+    header, reader = _read_csv_rows(path)
+
+    # Detect if multi-day format (first column contains "day")
+    has_day = header and 'day' in header[0].lower()
+    day_col = 0 if has_day else -1
+    from_col = 1 if has_day else 0
+    to_col = 2 if has_day else 1
+    room_col = 4 if has_day else 3
 
-            day_name = None
-            day_index = 0
-            if has_day:
-                day_name = row[day_col].strip().strip('"')
-                if day_name not in day_map:
-                    day_map[day_name] = len(day_map)
-                day_index = day_map[day_name]
-
-            from_hour = row[from_col].strip().strip('"')
-            to_hour = row[to_col].strip().strip('"')
-
-            # Create unique timeslot ID
-            slot_id = f"D{day_index}-{from_hour}-{to_hour}" if has_day else f"{from_hour}-{to_hour}"
-
-            if slot_id not in seen_slots:
-                seen_slots.add(slot_id)
-                timeslots.append(Timeslot(
-                    id=slot_id,
-                    from_hour=from_hour,
-                    to_hour=to_hour,
-                    day_index=day_index,
-                    day_name=day_name
-                ))
-
-            if len(row) > room_col:
-                room_name = row[room_col].strip().strip('"')
-                if room_name and room_name not in rooms_dict:
-                    rooms_dict[room_name] = Room(id=room_name, name=room_name)
+    seen_slots = set()
+    for row in reader:
+        if len(row) < (3 if has_day else 2):
+            continue
+
+        day_name = None
+        day_index = 0
+        if has_day:
+            day_name = row[day_col].strip()
+            if day_name not in day_map:
+                day_map[day_name] = len(day_map)
+            day_index = day_map[day_name]
+
+        from_hour = row[from_col].strip()
+        to_hour = row[to_col].strip()
+
+        # Create unique timeslot ID
+        slot_id = f"D{day_index}-{from_hour}-{to_hour}" if has_day else f"{from_hour}-{to_hour}"
+
+        if slot_id not in seen_slots:
+            seen_slots.add(slot_id)
+            timeslots.append(Timeslot(
+                id=slot_id,
+                from_hour=from_hour,
+                to_hour=to_hour,
+                day_index=day_index,
+                day_name=day_name
+            ))
+
+        if len(row) > room_col:
+            room_name = row[room_col].strip()
+            if room_name and room_name not in rooms_dict:
+                rooms_dict[room_name] = Room(id=room_name, name=room_name)
 
     timeslots.sort(key=lambda t: t.slot_index)
     rooms = list(rooms_dict.values())
@@ -444,100 +435,125 @@ def read_schedule_csv(path: Path) -> tuple[list[Timeslot], list[Room], list[str]
     return timeslots, rooms, day_names
 
 
-def read_talks_csv(path: Path, day_names: list[str]) -> tuple[list[Speaker], list[TalkSpeaker], list[Talk]]:
-    """Read talks CSV, returns (speakers, talk_speakers, talks)."""
+def read_talks_csv(path: Path, day_names: list[str]) -> tuple[list[Speaker], list[Talk]]:
+    """Read talks CSV, returns (speakers, talks)."""
     speakers_dict = {}
-    talk_speaker_links = []
     talks = []
+    day_lookup = build_day_lookup(day_names)
 
-    with open(path, 'r', encoding='utf-8') as f:
-        reader = csv.reader(f, delimiter=';', quotechar='"')
-        next(reader)  # Skip header
-
-        for row in reader:
-            if len(row) < 9:
-                continue
-
-            talk_id = row[0].strip().strip('"')
-            title = row[1].strip().strip('"')
-            level = row[2].strip().strip('"').upper() or "INTERMEDIATE"
-            summary = row[3].strip().strip('"')
-            track = row[4].strip().strip('"')
-            avail_str = row[5].strip().strip('"') if len(row) > 5 else ""
-            speaker_names_str = row[8].strip().strip('"')
-
-            # Parse available days
-            available_days = parse_available_days(avail_str, day_names)
-
-            # Create speakers and TalkSpeaker links
-            talk_speakers_list = []
-            for name in speaker_names_str.split(','):
-                name = name.strip()
-                if not name:
-                    continue
-                speaker_id = name.lower().replace(' ', '_')
-                if speaker_id not in speakers_dict:
-                    speakers_dict[speaker_id] = Speaker(
-                        id=speaker_id,
-                        name=name,
-                        available_days=available_days.copy()
-                    )
-                else:
-                    # Merge availability (intersection would be more restrictive)
-                    existing = speakers_dict[speaker_id]
-                    if available_days:
-                        if existing.available_days:
-                            existing.available_days &= available_days
-                        else:
-                            existing.available_days = available_days.copy()
-
-                speaker = speakers_dict[speaker_id]
-                talk_speakers_list.append(speaker)
-
-                # Create TalkSpeaker link for constraint stream
-                link_id = f"{talk_id}-{speaker_id}"
-                talk_speaker_links.append(TalkSpeaker(
-                    id=link_id,
-                    speaker=speaker,
-                    talk_id=talk_id
-                ))
-
-            talk = Talk(
-                id=talk_id,
-                title=title,
-                summary=summary,
-                track_name=track,
-                audience_level=level,
-                speakers=talk_speakers_list,
-                flow_order={"BEGINNER": 1, "INTERMEDIATE": 2, "ADVANCED": 3}.get(level, 2)
-            )
-            talks.append(talk)
-
-    return list(speakers_dict.values()), talk_speaker_links, talks
+    _, reader = _read_csv_rows(path)
 
+    for row in reader:
+        if len(row) < 9:
+            continue
 
-def parse_available_days(avail_str: str, day_names: list[str]) -> set[int]:
-    """Parse availability string like 'Wednesday,Thursday' or '1,2,3'."""
-    available = set()
+        talk_id = row[0].strip()
+        title = row[1].strip()
+        level = row[2].strip().upper() or "INTERMEDIATE"
+        summary = row[3].strip()
+        track = row[4].strip()
+        avail_str = row[5].strip() if len(row) > 5 else ""
+        speaker_names_str = row[8].strip()
+
+        # Parse available days
+        available_mask = parse_available_days(avail_str, day_names, day_lookup)
+
+        # Create or merge speakers
+        talk_speakers_list = []
+        for name in speaker_names_str.split(','):
+            name = name.strip()
+            if not name:
+                continue
+            speaker_id = name.lower().replace(' ', '_')
+            if speaker_id not in speakers_dict:
+                speakers_dict[speaker_id] = Speaker(
+                    id=speaker_id,
+                    name=name,
+                    available_mask=available_mask
+                )
+            else:
+                # Merge availability (intersection would be more restrictive);
+                # an empty intersection leaves the speaker unrestricted
+                existing = speakers_dict[speaker_id]
+                existing.available_mask = (existing.available_mask & available_mask) or ALL_DAYS
+
+            speaker = speakers_dict[speaker_id]
+            talk_speakers_list.append(speaker)
+
+        talk = Talk(
+            id=talk_id,
+            title=title,
+            summary=summary,
+            track_name=track,
+            audience_level=level,
+            speakers=talk_speakers_list,
+            flow_order={"BEGINNER": 1, "INTERMEDIATE": 2, "ADVANCED": 3}.get(level, 2)
+        )
+        talks.append(talk)
+
+    return list(speakers_dict.values()), talks
+
+
+def _match_day_name(part: str, day_names: list[str]) -> Optional[int]:
+    """Index of the first day name that contains, or is contained in, part."""
+    for i, day_name in enumerate(day_names):
+        if part in day_name.lower() or day_name.lower() in part:
+            return i
+    return None
+
+
+def build_day_lookup(day_names: list[str]) -> dict[str, int]:
+    """Map lowercased day names and their 3-letter prefixes to day indices."""
+    lookup = {}
+    for day_name in day_names:
+        for key in (day_name.lower(), day_name.lower()[:3]):
+            # Numeric tokens are day numbers, never names
+            if key and key not in lookup and not key.isdigit():
+                index = _match_day_name(key, day_names)
+                if index is not None:
+                    lookup[key] = index
+    return lookup
+
+
+def parse_available_days(
+    avail_str: str,
+    day_names: list[str],
+    day_lookup: Optional[dict[str, int]] = None
+) -> int:
+    """Parse availability string like 'Wednesday,Thursday' or '1,2,3' into a day bitmask.
+
+    Returns ALL_DAYS when nothing in the string names a day. day_lookup comes
+    from build_day_lookup and is built here when omitted; tokens resolved by
+    substring matching are added to it, so callers parsing many rows should
+    pass the same dict each time.
+    """
+    if day_lookup is None:
+        day_lookup = build_day_lookup(day_names)
+
+    mask = 0
+    matched = False
     for part in avail_str.replace(';', ',').split(','):
         part = part.strip().lower()
         if not part:
             continue
 
-        # Try numeric
-        try:
-            available.add(int(part) - 1)  # Convert 1-based to 0-based
-            continue
-        except ValueError:
-            pass
+        index = day_lookup.get(part)
+        if index is None:
+            # Try numeric
+            try:
+                index = int(part) - 1  # Convert 1-based to 0-based
+            except ValueError:
+                # Try matching day names
+                index = _match_day_name(part, day_names)
+                if index is None:
+                    continue
+                day_lookup[part] = index
 
-        # Try matching day names
-        for i, day_name in enumerate(day_names):
-            if part in day_name.lower() or day_name.lower() in part:
-                available.add(i)
-                break
+        matched = True
+        if index >= 0:
+            mask |= 1 << index
 
-    return available
+    return mask if matched else ALL_DAYS
 
 
 # =============================================================================
@@ -549,20 +565,41 @@ def create_problem(
     timeslots: list[Timeslot],
     rooms: list[Room],
     speakers: list[Speaker],
-    talk_speakers: list[TalkSpeaker],
     talks: list[Talk]
 ) -> ConferenceSchedule:
     """Create the planning problem with unassigned talk assignments."""
-    talk_assignments = [
-        TalkAssignment(id=f"assign-{talk.id}", talk=talk)
-        for talk in talks
-    ]
+    # Speaker availability is only final once every talk has been read
+    for talk in talks:
+        talk.all_speakers_mask = ALL_DAYS
+        for speaker in talk.speakers:
+            talk.all_speakers_mask &= speaker.available_mask
+
+    talk_ids_by_speaker = {}
+    for talk in talks:
+        for speaker in talk.speakers:
+            talk_ids_by_speaker.setdefault(speaker.id, set()).add(talk.id)
+    for talk in talks:
+        co_speaker_talk_ids = set()
+        for speaker in talk.speakers:
+            co_speaker_talk_ids |= talk_ids_by_speaker[speaker.id]
+        co_speaker_talk_ids.discard(talk.id)
+        talk.co_speaker_talk_ids = frozenset(co_speaker_talk_ids)
+
+    talk_assignments = []
+    for talk in talks:
+        # A talk whose speakers share no available day keeps every timeslot, so
+        # the speaker availability constraint can still report it
+        available_timeslots = [
+            ts for ts in timeslots if (talk.all_speakers_mask >> ts.day_index) & 1
+        ] or list(timeslots)
+        talk_assignments.append(TalkAssignment(
+            id=f"assign-{talk.id}", talk=talk, available_timeslots=available_timeslots
+        ))
 
     return ConferenceSchedule(
         timeslots=timeslots,
         rooms=rooms,
         speakers=speakers,
-        talk_speakers=talk_speakers,
         talks=talks,
         talk_assignments=talk_assignments,
         score=None
@@ -591,103 +628,93 @@ def solve(problem: ConferenceSchedule, time_limit_seconds: int) -> ConferenceSch
 # =============================================================================
 
 
-def write_csv_output(solution: ConferenceSchedule, path: Path, multi_day: bool):
-    """Write schedule to CSV."""
-    assignments = [a for a in solution.talk_assignments if a.timeslot and a.room]
-    assignments.sort(key=lambda a: (a.timeslot.slot_index, a.room.name))
+def _sorted_assignments(solution: ConferenceSchedule) -> list[TalkAssignment]:
+    """Scheduled assignments ordered by timeslot, then room name."""
+    # Decorate once so the sort compares plain tuples; the position breaks ties
+    decorated = [
+        (a.timeslot.slot_index, a.room.name, i, a)
+        for i, a in enumerate(solution.talk_assignments)
+        if a.timeslot and a.room
+    ]
+    decorated.sort()
+    return [d[-1] for d in decorated]
+
 
+def write_csv_output(assignments: list[TalkAssignment], path: Path, multi_day: bool):
+    """Write schedule to CSV from assignments in _sorted_assignments order."""
     with open(path, 'w', newline='', encoding='utf-8') as f:
         writer = csv.writer(f, delimiter=';', quotechar='"', quoting=csv.QUOTE_ALL)
 
         if multi_day:
             writer.writerow(['Day', 'Talk ID', 'From', 'To', 'Room', 'Title',
                            'Speakers', 'Level', 'Track'])
-            for a in assignments:
-                speakers_str = ", ".join(s.name for s in a.talk.speakers)
-                writer.writerow([
-                    a.timeslot.day_display, a.talk.id, a.timeslot.from_hour,
-                    a.timeslot.to_hour, a.room.name, a.talk.title, speakers_str,
-                    a.talk.audience_level, a.talk.track_name
-                ])
+            writer.writerows(
+                (a.timeslot.day_display, a.talk.id, a.timeslot.from_hour,
+                 a.timeslot.to_hour, a.room.name, a.talk.title,
+                 a.talk.speakers_str,
+                 a.talk.audience_level, a.talk.track_name)
+                for a in assignments
+            )
         else:
             writer.writerow(['Talk ID', 'From', 'To', 'Room', 'Title',
                            'Speakers', 'Level', 'Track'])
-            for a in assignments:
-                speakers_str = ", ".join(s.name for s in a.talk.speakers)
-                writer.writerow([
-                    a.talk.id, a.timeslot.from_hour, a.timeslot.to_hour,
-                    a.room.name, a.talk.title, speakers_str,
-                    a.talk.audience_level, a.talk.track_name
-                ])
+            writer.writerows(
+                (a.talk.id, a.timeslot.from_hour, a.timeslot.to_hour,
+                 a.room.name, a.talk.title,
+                 a.talk.speakers_str,
+                 a.talk.audience_level, a.talk.track_name)
+                for a in assignments
+            )
 
 
-def write_markdown_output(solution: ConferenceSchedule, path: Path, multi_day: bool):
-    """Write schedule to Markdown."""
-    assignments = [a for a in solution.talk_assignments if a.timeslot and a.room]
-    assignments.sort(key=lambda a: (a.timeslot.slot_index, a.room.name))
+def write_markdown_output(assignments: list[TalkAssignment], path: Path, multi_day: bool):
+    """Write schedule to Markdown from assignments in _sorted_assignments order."""
+    buf = io.StringIO()
+    buf.write("# Conference Schedule\n")
 
-    lines = ["# Conference Schedule\n"]
-    current_day = -1
-    current_slot = None
+    for day_display, day_group in groupby(assignments, key=lambda a: a.timeslot.day_display):
+        # Day header for multi-day
+        if multi_day:
+            buf.write(f"\n---\n\n# {day_display}\n")
 
-    for a in assignments:
-        ts = a.timeslot
+        for ts, slot_group in groupby(day_group, key=lambda a: a.timeslot):
+            # Timeslot header
+            buf.write(f"\n## {ts.from_hour} - {ts.to_hour}\n"
+                      "\n| Room | ID | Title | Speaker | Level | Track |"
+                      "\n|------|-----|-------|---------|-------|-------|")
 
-        # Day header for multi-day
-        if multi_day and ts.day_index != current_day:
-            current_day = ts.day_index
-            current_slot = None
-            lines.append(f"\n---\n\n# {ts.day_display}\n")
-
-        # Timeslot header
-        if ts.id != current_slot:
-            current_slot = ts.id
-            lines.append(f"\n## {ts.from_hour} - {ts.to_hour}\n")
-            lines.append("\n| Room | ID | Title | Speaker | Level | Track |")
-            lines.append("\n|------|-----|-------|---------|-------|-------|")
-
-        title = a.talk.title.replace('|', '\\|')
-        speakers_str = ", ".join(s.name for s in a.talk.speakers)
-        lines.append(f"\n| {a.room.name} | {a.talk.id} | {title} | {speakers_str} | "
-                    f"{a.talk.audience_level} | {a.talk.track_name} |")
+            for a in slot_group:
+                title = a.talk.title.replace('|', '\\|')
+                buf.write(f"\n| {a.room.name} | {a.talk.id} | {title} | {a.talk.speakers_str} | "
+                          f"{a.talk.audience_level} | {a.talk.track_name} |")
 
     with open(path, 'w', encoding='utf-8') as f:
-        f.write(''.join(lines))
+        f.write(buf.getvalue())
 
 
-def print_schedule(solution: ConferenceSchedule, multi_day: bool):
-    """Print schedule to console."""
-    assignments = [a for a in solution.talk_assignments if a.timeslot and a.room]
-    assignments.sort(key=lambda a: (a.timeslot.slot_index, a.room.name))
-
+def print_schedule(assignments: list[TalkAssignment], multi_day: bool):
+    """Print schedule to console from assignments in _sorted_assignments order."""
     print("\n" + "=" * 100)
     print("CONFERENCE SCHEDULE")
     print("=" * 100)
 
-    current_day = -1
-    current_slot = None
-
-    for a in assignments:
-        ts = a.timeslot
-
-        if multi_day and ts.day_index != current_day:
-            current_day = ts.day_index
-            current_slot = None
+    for day_display, day_group in groupby(assignments, key=lambda a: a.timeslot.day_display):
+        if multi_day:
             print("\n" + "=" * 100)
-            print(f">>> {ts.day_display.upper()} <<<")
+            print(f">>> {day_display.upper()} <<<")
             print("=" * 100)
 
-        if ts.id != current_slot:
-            current_slot = ts.id
+        for ts, slot_group in groupby(day_group, key=lambda a: a.timeslot):
             print("\n" + "-" * 100)
             print(f"TIME SLOT: {ts.from_hour} - {ts.to_hour}")
             print("-" * 100)
 
-        title = a.talk.title[:50] + "..." if len(a.talk.title) > 50 else a.talk.title
-        speakers_str = ", ".join(s.name for s in a.talk.speakers)
-        speakers_str = speakers_str[:20] + "..." if len(speakers_str) > 20 else speakers_str
-        print(f"  {a.room.name:10} | {a.talk.id:>5} | {title:50} | "
-              f"{speakers_str:20} | {a.talk.audience_level:12} | {a.talk.track_name}")
+            for a in slot_group:
+                title = a.talk.title[:50] + "..." if len(a.talk.title) > 50 else a.talk.title
+                speakers_str = a.talk.speakers_str
+                speakers_str = speakers_str[:20] + "..." if len(speakers_str) > 20 else speakers_str
+                print(f"  {a.room.name:10} | {a.talk.id:>5} | {title:50} | "
+                      f"{speakers_str:20} | {a.talk.audience_level:12} | {a.talk.track_name}")
 
     print("\n" + "=" * 100)
 
@@ -716,7 +743,7 @@ def main():
     # Read input
     print("\nReading input files...")
     timeslots, rooms, day_names = read_schedule_csv(Path(args.schedule_csv))
-    speakers, talk_speakers, talks = read_talks_csv(Path(args.talks_csv), day_names)
+    speakers, talks = read_talks_csv(Path(args.talks_csv), day_names)
 
     multi_day = len(day_names) > 1
     print(f"   - Days: {len(day_names) or 1}" +
@@ -725,7 +752,7 @@ def main():
     print(f"   - Rooms: {len(rooms)}")
     print(f"   - Talks: {len(talks)}")
     print(f"   - Speakers: {len(speakers)}")
-    print(f"   - Tracks: {len(set(t.track_name for t in talks))}")
+    print(f"   - Tracks: {len({t.track_name for t in talks})}")
 
     # Check capacity
     capacity = len(timeslots) * len(rooms)
@@ -733,7 +760,7 @@ def main():
         print(f"   Warning: More talks ({len(talks)}) than slots ({capacity})")
 
     # Create problem
-    problem = create_problem(timeslots, rooms, speakers, talk_speakers, talks)
+    problem = create_problem(timeslots, rooms, speakers, talks)
 
     # Solve
     print(f"\nSolving with time limit: {args.time_limit} seconds...")
@@ -743,14 +770,15 @@ def main():
     print(f"   Score: {solution.score}")
 
     # Output
-    print_schedule(solution, multi_day)
+    assignments = _sorted_assignments(solution)
+    print_schedule(assignments, multi_day)
 
     output_path = Path(args.output_csv)
-    write_csv_output(solution, output_path, multi_day)
+    write_csv_output(assignments, output_path, multi_day)
     print(f"\nSchedule written to: {output_path}")
 
     md_path = output_path.with_suffix('.md')
-    write_markdown_output(solution, md_path, multi_day)
+    write_markdown_output(assignments, md_path, multi_day)
     print(f"Markdown written to: {md_path}")
 
 